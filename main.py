@@ -7,7 +7,8 @@ from utils.data_processing import get_stock_data
 from utils.optimization import (
     maximize_sharpe_ratio,
     minimize_volatility,
-    efficient_optimization,
+    frontier_osqp,
+    frontier_slsqp,
     calculate_portfolio_performance,
 )
 from utils.visualization import plot_efficient_frontier
@@ -117,9 +118,13 @@ def main():
 
     # Efficient frontier calculation
     target_returns = np.linspace(min_vol_performance[1], max_sharpe_performance[1], 50)
-    efficient_volatilities = [
-        efficient_optimization(mean_returns, covariance_matrix, r).fun for r in target_returns
-    ]
+    try:
+        efficient_volatilities, _ = frontier_osqp(mean_returns, covariance_matrix, target_returns)
+    except ImportError:
+        # Without osqp>=1.0, warm-start SLSQP solves from the min volatility weights
+        efficient_volatilities, _ = frontier_slsqp(
+            mean_returns, covariance_matrix, target_returns, x0=min_vol_result.x
+        )
 
     # Plot the results
     plot_efficient_frontier(
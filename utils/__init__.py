@@ -5,7 +5,6 @@ Initialization file for utils module.
 # You can import key functions here to make them easily accessible
 from .data_processing import get_stock_data
 from .optimization import maximize_sharpe_ratio, minimize_volatility, efficient_optimization
-from .visualization import plot_efficient_frontier
 
 __all__ = [
     "get_stock_data",
@@ -14,3 +13,12 @@ __all__ = [
     "efficient_optimization",
     "plot_efficient_frontier",
 ]
+
+
+def __getattr__(name):
+    # Import the plotting module on first use so importing utils does not pull in plotly
+    if name == "plot_efficient_frontier":
+        from .visualization import plot_efficient_frontier
+
+        return plot_efficient_frontier
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
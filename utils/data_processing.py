@@ -1,5 +1,121 @@
+import hashlib
+import os
+import tempfile
+from functools import lru_cache
+
+import numpy as np
 import yfinance as yf
 import pandas as pd
+from scipy.linalg.blas import dsyrk
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "ef")
+
+
+def _cache_path(stock_symbols, start_date, end_date):
+    """
+    Builds the on-disk cache location for a (symbols, start, end) download.
+    """
+    key = "|".join(
+        [
+            ",".join(stock_symbols),
+            "adjusted",
+            pd.Timestamp(start_date).isoformat(),
+            pd.Timestamp(end_date).isoformat(),
+        ]
+    )
+    return os.path.join(CACHE_DIR, hashlib.sha1(key.encode()).hexdigest() + ".pkl")
+
+
+def _return_statistics(prices):
+    """
+    Mean and sample covariance of daily returns, computed in one pass over a single buffer.
+
+    Returns are written into a preallocated array, demeaned in place, and reduced to the
+    covariance with a symmetric rank-k update (BLAS dsyrk), so no intermediate price or return
+    frames are allocated.
+
+    Args:
+        prices (numpy.ndarray): Daily closing prices, one row per day (T, n).
+
+    Returns:
+        tuple: Mean daily returns (n,) and covariance matrix of the daily returns (n, n).
+    """
+    daily_returns = np.empty((len(prices) - 1, prices.shape[1]))
+    np.divide(prices[1:], prices[:-1], out=daily_returns)
+    daily_returns -= 1
+    mean_returns = daily_returns.mean(axis=0)
+    daily_returns -= mean_returns
+
+    # dsyrk fills only the upper triangle; the transposed view is Fortran-ordered, so no copy
+    covariance_matrix = dsyrk(1.0 / (len(daily_returns) - 1), daily_returns.T)
+    lower = np.tril_indices_from(covariance_matrix, -1)
+    covariance_matrix[lower] = covariance_matrix.T[lower]
+    return mean_returns, covariance_matrix
+
+
+def _is_complete_download(closing_prices, end_date):
+    """
+    Whether a download is final and safe to persist: every ticker returned data and the window
+    ends before today, so later runs would not see more rows.
+    """
+    if closing_prices.empty or np.any(closing_prices.isna().all(axis=0)):
+        return False
+    return pd.Timestamp(end_date).normalize() < pd.Timestamp.today().normalize()
+
+
+def _read_cache(cache_path):
+    """
+    Loads a cached download, treating a missing or unreadable file as a cache miss.
+    """
+    try:
+        return pd.read_pickle(cache_path)
+    except Exception:
+        return None
+
+
+def _write_cache(closing_prices, cache_path):
+    """
+    Persists a download through a temporary file and an atomic rename, so an interrupted run
+    never leaves a truncated cache file behind. A cache that cannot be written is skipped.
+    """
+    tmp_path = None
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix=".tmp")
+        os.close(fd)
+        closing_prices.to_pickle(tmp_path)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"Could not cache stock data: {e}")
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+@lru_cache(maxsize=None)
+def _get_closing_prices(stock_symbols, start_date, end_date):
+    """
+    Downloads closing prices, memoized in-process and persisted to disk between runs.
+
+    Args:
+        stock_symbols (tuple): Sorted stock ticker symbols.
+        start_date (datetime): Start date for fetching data.
+        end_date (datetime): End date for fetching data.
+
+    Returns:
+        pandas.DataFrame: Daily split- and dividend-adjusted closing prices of the stocks.
+    """
+    cache_path = _cache_path(stock_symbols, start_date, end_date)
+    closing_prices = _read_cache(cache_path)
+    # Ignore a cached download with a failed ticker so it is fetched again
+    if closing_prices is not None and _is_complete_download(closing_prices, end_date):
+        return closing_prices
+
+    closing_prices = yf.download(
+        list(stock_symbols), start=start_date, end=end_date, auto_adjust=True
+    )["Close"]
+    if _is_complete_download(closing_prices, end_date):
+        _write_cache(closing_prices, cache_path)
+    return closing_prices
 
 
 def get_stock_data(stock_symbols, start_date, end_date):
@@ -15,16 +131,34 @@ def get_stock_data(stock_symbols, start_date, end_date):
         tuple: Mean returns and covariance matrix of the stocks.
     """
     try:
-        # Download historical stock data using yfinance
-        stock_data = yf.download(stock_symbols, start=start_date, end=end_date)
-        closing_prices = stock_data["Close"]
+        # Download historical stock data using yfinance, or reuse a cached download
+        closing_prices = _get_closing_prices(tuple(sorted(stock_symbols)), start_date, end_date)
+
+        prices = closing_prices.to_numpy(dtype=np.float64, copy=False)
+        if np.isnan(prices).any():
+            # With gaps or tickers of different history lengths, use each column's own returns
+            # for the means and pairwise-complete rows for the covariance
+            daily_returns = closing_prices.ffill().pct_change(fill_method=None)
+            mean_returns, covariance_matrix = daily_returns.mean(), daily_returns.cov()
 
-        # Calculate daily returns
-        daily_returns = closing_prices.pct_change()
+            # Drop tickers that failed to download or have too little history, since non-finite
+            # statistics would make the solvers fail
+            failed = mean_returns.index[~np.isfinite(mean_returns.to_numpy())]
+            if len(failed):
+                print(f"Dropping tickers without enough price data: {', '.join(failed)}")
+                mean_returns = mean_returns.drop(failed)
+                covariance_matrix = covariance_matrix.drop(index=failed, columns=failed)
+            if mean_returns.empty or not np.isfinite(covariance_matrix.to_numpy()).all():
+                print("Error fetching stock data: not enough overlapping price history")
+                return None, None
+            return mean_returns, covariance_matrix
 
-        # Calculate mean returns and covariance matrix
-        mean_returns = daily_returns.mean()
-        covariance_matrix = daily_returns.cov()
+        # Calculate mean returns and covariance matrix on the raw price array, labelling them
+        # only at the boundary
+        symbols = closing_prices.columns
+        mean_returns, covariance_matrix = _return_statistics(prices)
+        mean_returns = pd.Series(mean_returns, index=symbols)
+        covariance_matrix = pd.DataFrame(covariance_matrix, index=symbols, columns=symbols)
 
         return mean_returns, covariance_matrix
     except Exception as e:
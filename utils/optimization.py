@@ -1,5 +1,62 @@
 import numpy as np
-from scipy.optimize import minimize
+from scipy import sparse
+from scipy.linalg import LinAlgError, cho_factor, cho_solve, cholesky, eigh, qr
+from scipy.linalg.blas import dtrmv
+from scipy.optimize import OptimizeResult, minimize
+
+def _as_array(values):
+    """
+    Converts a pandas object or array-like to a C-contiguous float64 ndarray.
+    """
+    return np.ascontiguousarray(getattr(values, "values", values), dtype=np.float64)
+
+
+def _perf(portfolio_weights, mean_returns, covariance_matrix):
+    """
+    Annualized standard deviation and returns for ndarray inputs.
+    """
+    annual_std_dev = np.sqrt(portfolio_weights @ covariance_matrix @ portfolio_weights) * np.sqrt(252)
+    annual_returns = mean_returns @ portfolio_weights * 252
+    return annual_std_dev, annual_returns
+
+
+def _neg_sharpe(portfolio_weights, mean_returns, covariance_matrix, risk_free_rate):
+    """
+    Negative Sharpe ratio for ndarray inputs.
+    """
+    portfolio_std_dev, portfolio_returns = _perf(portfolio_weights, mean_returns, covariance_matrix)
+    return -(portfolio_returns - risk_free_rate) / portfolio_std_dev
+
+
+def _sum_minus_one(portfolio_weights):
+    """
+    Budget constraint: the weights sum to one.
+    """
+    return np.sum(portfolio_weights) - 1
+
+
+def _sum_minus_one_jac(portfolio_weights):
+    """
+    Gradient of the budget constraint.
+    """
+    return np.ones_like(portfolio_weights)
+
+
+def _return_minus_target(portfolio_weights, mean_returns, return_target):
+    """
+    Target return constraint: the portfolio return equals the target.
+    """
+    return portfolio_weights @ mean_returns - return_target
+
+
+def _return_minus_target_jac(portfolio_weights, mean_returns, return_target):
+    """
+    Gradient of the target return constraint.
+    """
+    return mean_returns
+
+
+_BUDGET_CONSTRAINT = {"type": "eq", "fun": _sum_minus_one, "jac": _sum_minus_one_jac}
 
 
 def calculate_portfolio_performance(portfolio_weights, mean_returns, covariance_matrix):
@@ -14,11 +71,96 @@ def calculate_portfolio_performance(portfolio_weights, mean_returns, covariance_
     Returns:
         tuple: Annualized standard deviation and annualized returns of the portfolio.
     """
-    annual_returns = np.sum(mean_returns * portfolio_weights) * 252
-    annual_std_dev = np.sqrt(
-        np.dot(portfolio_weights.T, np.dot(covariance_matrix, portfolio_weights))
-    ) * np.sqrt(252)
-    return annual_std_dev, annual_returns
+    return _perf(
+        _as_array(portfolio_weights),
+        _as_array(mean_returns),
+        _as_array(covariance_matrix),
+    )
+
+
+def calculate_portfolio_performance_batch(portfolio_weights, mean_returns, covariance_matrix):
+    """
+    Calculates the annualized performance of many portfolios at once.
+
+    Args:
+        portfolio_weights (numpy.ndarray): Matrix of portfolio weights, one portfolio per row (k, n).
+        mean_returns (pandas.Series): Mean returns of the stocks.
+        covariance_matrix (pandas.DataFrame): Covariance matrix of the stocks.
+
+    Returns:
+        tuple: Annualized standard deviations (k,) and annualized returns (k,) of the portfolios.
+    """
+    weights = _as_array(portfolio_weights)
+    mu = _as_array(mean_returns)
+    cov = _as_array(covariance_matrix)
+    annual_returns = weights @ mu * 252
+    variances = np.einsum("ki,ij,kj->k", weights, cov, weights, optimize=True)
+    return np.sqrt(variances) * np.sqrt(252), annual_returns
+
+
+def _annualize(mean_returns, covariance_matrix):
+    """
+    Annualized mean returns and covariance as float64 arrays, scaled once outside the optimizer.
+    """
+    return _as_array(mean_returns) * 252, _as_array(covariance_matrix) * 252
+
+
+def _cholesky_factor(covariance_matrix):
+    """
+    Upper triangular factor U of the covariance matrix (S = U.T @ U), laid out for BLAS.
+
+    This is the Cholesky factor when S is positive definite. A singular but positive
+    semi-definite S (e.g. a duplicated or constant-price asset) has no Cholesky factor, so the
+    eigen square root F = sqrt(L) V.T is reduced to triangular form with a QR decomposition
+    instead: F = Q R gives S = F.T F = R.T R.
+    """
+    try:
+        return np.asfortranarray(cholesky(covariance_matrix))
+    except LinAlgError:
+        eigenvalues, eigenvectors = eigh(covariance_matrix)
+        square_root = np.sqrt(np.clip(eigenvalues, 0, None))[:, np.newaxis] * eigenvectors.T
+        return np.asfortranarray(qr(square_root, mode="r")[0])
+
+
+class _VolatilityObjective:
+    """
+    Portfolio volatility ||U w|| and its gradient U.T (U w) / ||U w|| as an optimizer objective.
+
+    SLSQP evaluates the objective and its gradient at the same point, so U w and the volatility
+    from the last objective call are cached and reused by the gradient.
+    """
+
+    def __init__(self, cholesky_factor):
+        self.cholesky_factor = cholesky_factor
+        self._weights = None
+        self._y = None
+        self._volatility = None
+
+    def _evaluate(self, portfolio_weights):
+        if self._weights is None or not np.array_equal(portfolio_weights, self._weights):
+            self._weights = np.array(portfolio_weights, dtype=np.float64)
+            self._y = dtrmv(self.cholesky_factor, self._weights)
+            self._volatility = np.sqrt(self._y @ self._y)
+        return self._y, self._volatility
+
+    def __call__(self, portfolio_weights):
+        return self._evaluate(portfolio_weights)[1]
+
+    def jac(self, portfolio_weights):
+        y, volatility = self._evaluate(portfolio_weights)
+        if volatility == 0:
+            return np.zeros_like(y)
+        return dtrmv(self.cholesky_factor, y, trans=1) / volatility
+
+
+def _neg_sharpe_chol(portfolio_weights, mean_returns, cholesky_factor, risk_free_rate):
+    """
+    Negative Sharpe ratio used as the optimizer objective, with the variance taken from U w.
+    """
+    y = dtrmv(cholesky_factor, portfolio_weights)
+    portfolio_std_dev = np.sqrt(y @ y)
+    portfolio_returns = mean_returns @ portfolio_weights
+    return -(portfolio_returns - risk_free_rate) / portfolio_std_dev
 
 
 def negative_sharpe_ratio(portfolio_weights, mean_returns, covariance_matrix, risk_free_rate=0):
@@ -34,14 +176,116 @@ def negative_sharpe_ratio(portfolio_weights, mean_returns, covariance_matrix, ri
     Returns:
         float: Negative Sharpe ratio.
     """
-    portfolio_std_dev, portfolio_returns = calculate_portfolio_performance(
-        portfolio_weights, mean_returns, covariance_matrix
+    return _neg_sharpe(
+        _as_array(portfolio_weights),
+        _as_array(mean_returns),
+        _as_array(covariance_matrix),
+        float(risk_free_rate),
+    )
+
+
+def _tangency_weights(mean_returns, cholesky_factor, risk_free_rate, constraint_set):
+    """
+    Initial guess for the max Sharpe solve from the closed-form tangency portfolio.
+
+    Without bounds the max Sharpe weights are proportional to inv(S) (mu - rf); this solves that
+    system with the existing Cholesky factor, then clips to the bounds and renormalizes. Falls
+    back to equal weights when the result cannot be normalized.
+    """
+    num_assets = len(mean_returns)
+    equal_weights = np.full(num_assets, 1.0 / num_assets)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z = cho_solve((cholesky_factor, False), mean_returns - risk_free_rate)
+    # A singular factor leaves the system without a unique solution
+    if not np.all(np.isfinite(z)) or z.sum() <= 0:
+        return equal_weights
+
+    lower, upper = constraint_set
+    weights = np.clip(
+        z / z.sum(),
+        -np.inf if lower is None else lower,
+        np.inf if upper is None else upper,
     )
-    sharpe_ratio = (portfolio_returns - risk_free_rate) / portfolio_std_dev
-    return -sharpe_ratio
+    if weights.sum() <= 0:
+        return equal_weights
+    return weights / weights.sum()
 
 
-def maximize_sharpe_ratio(mean_returns, covariance_matrix, risk_free_rate=0, constraint_set=(0, 1)):
+def _box_constraints(cp, weights, constraint_set, scale=1):
+    """
+    cvxpy bound constraints on the weights, skipping sides left open with None.
+    """
+    lower, upper = constraint_set
+    constraints = []
+    if lower is not None:
+        constraints.append(weights >= lower * scale)
+    if upper is not None:
+        constraints.append(weights <= upper * scale)
+    return constraints
+
+
+def _cvxpy_result(cp, problem, weights, fun, num_assets):
+    """
+    Wraps a solved cvxpy problem in the OptimizeResult interface returned by the SLSQP path.
+
+    A failed solve keeps the same shape as a successful one: x is a NaN vector of length
+    num_assets and fun is NaN.
+    """
+    success = problem.status in (cp.OPTIMAL, cp.OPTIMAL_INACCURATE)
+    return OptimizeResult(
+        x=weights if success else np.full(num_assets, np.nan),
+        fun=fun if success else np.nan,
+        success=success,
+        status=problem.status,
+        message=problem.status,
+    )
+
+
+def _maximize_sharpe_ratio_cvxpy(mu, cov, risk_free_rate, constraint_set):
+    """
+    Solves the max Sharpe problem as a QP via the Cornuejols-Tutuncu change of variables.
+
+    With y = kappa * w and the scale fixed by (mu - rf).T y = 1, maximizing the Sharpe ratio
+    becomes minimizing y.T S y; the weights are recovered as w = y / sum(y).
+    """
+    import cvxpy as cp
+
+    y = cp.Variable(len(mu))
+    kappa = cp.Variable(nonneg=True)
+    constraints = [
+        (mu - risk_free_rate) @ y == 1,
+        cp.sum(y) == kappa,
+    ] + _box_constraints(cp, y, constraint_set, kappa)
+    problem = cp.Problem(cp.Minimize(cp.quad_form(y, cov)), constraints)
+    problem.solve(solver=cp.OSQP)
+
+    weights = fun = None
+    if y.value is not None:
+        weights = y.value / y.value.sum()
+        fun = -(mu @ weights - risk_free_rate) / np.sqrt(weights @ cov @ weights)
+    return _cvxpy_result(cp, problem, weights, fun, len(mu))
+
+
+def _minimize_volatility_cvxpy(cov, constraint_set):
+    """
+    Solves the min volatility problem as a single convex QP.
+    """
+    import cvxpy as cp
+
+    w = cp.Variable(cov.shape[0])
+    constraints = [cp.sum(w) == 1] + _box_constraints(cp, w, constraint_set)
+    problem = cp.Problem(cp.Minimize(cp.quad_form(w, cov)), constraints)
+    problem.solve(solver=cp.OSQP)
+
+    fun = None
+    if w.value is not None:
+        fun = np.sqrt(w.value @ cov @ w.value)
+    return _cvxpy_result(cp, problem, w.value, fun, cov.shape[0])
+
+
+def maximize_sharpe_ratio(
+    mean_returns, covariance_matrix, risk_free_rate=0, constraint_set=(0, 1), backend="scipy"
+):
     """
     Maximizes the Sharpe ratio by optimizing portfolio weights.
 
@@ -50,17 +294,27 @@ def maximize_sharpe_ratio(mean_returns, covariance_matrix, risk_free_rate=0, con
         covariance_matrix (pandas.DataFrame): Covariance matrix of the stocks.
         risk_free_rate (float): Risk-free rate of return.
         constraint_set (tuple): Bounds for each asset's allocation in the portfolio.
+        backend (str): "scipy" for SLSQP, or "cvxpy" to solve the equivalent QP (requires cvxpy).
 
     Returns:
         OptimizeResult: Optimization result containing portfolio weights and performance metrics.
     """
+    if backend not in ("scipy", "cvxpy"):
+        raise ValueError(f"Unknown optimization backend: {backend}")
     num_assets = len(mean_returns)
-    args = (mean_returns, covariance_matrix, risk_free_rate)
-    constraints = {"type": "eq", "fun": lambda x: np.sum(x) - 1}
+    mu, cov = _annualize(mean_returns, covariance_matrix)
+    if backend == "cvxpy":
+        result = _maximize_sharpe_ratio_cvxpy(mu, cov, float(risk_free_rate), constraint_set)
+        if not result.success:
+            print("Warning: Optimization did not converge")
+        return result
+    chol = _cholesky_factor(cov)
+    args = (mu, chol, float(risk_free_rate))
+    constraints = _BUDGET_CONSTRAINT
     bounds = tuple(constraint_set for _ in range(num_assets))
     result = minimize(
-        negative_sharpe_ratio,
-        num_assets * [1.0 / num_assets],
+        _neg_sharpe_chol,
+        _tangency_weights(mu, chol, float(risk_free_rate), constraint_set),
         args=args,
         method="SLSQP",
         bounds=bounds,
@@ -71,7 +325,7 @@ def maximize_sharpe_ratio(mean_returns, covariance_matrix, risk_free_rate=0, con
     return result
 
 
-def minimize_volatility(mean_returns, covariance_matrix, constraint_set=(0, 1)):
+def minimize_volatility(mean_returns, covariance_matrix, constraint_set=(0, 1), backend="scipy"):
     """
     Minimizes the portfolio volatility by optimizing portfolio weights.
 
@@ -79,16 +333,27 @@ def minimize_volatility(mean_returns, covariance_matrix, constraint_set=(0, 1)):
         mean_returns (pandas.Series): Mean returns of the stocks.
         covariance_matrix (pandas.DataFrame): Covariance matrix of the stocks.
         constraint_set (tuple): Bounds for each asset's allocation in the portfolio.
+        backend (str): "scipy" for SLSQP, or "cvxpy" to solve the QP directly (requires cvxpy).
 
     Returns:
         OptimizeResult: Optimization result containing portfolio weights and performance metrics.
     """
+    if backend not in ("scipy", "cvxpy"):
+        raise ValueError(f"Unknown optimization backend: {backend}")
     num_assets = len(mean_returns)
-    constraints = {"type": "eq", "fun": lambda x: np.sum(x) - 1}
+    _, cov = _annualize(mean_returns, covariance_matrix)
+    if backend == "cvxpy":
+        result = _minimize_volatility_cvxpy(cov, constraint_set)
+        if not result.success:
+            print("Warning: Optimization did not converge")
+        return result
+    objective = _VolatilityObjective(_cholesky_factor(cov))
+    constraints = _BUDGET_CONSTRAINT
     bounds = tuple(constraint_set for _ in range(num_assets))
     result = minimize(
-        lambda x: calculate_portfolio_performance(x, mean_returns, covariance_matrix)[0],
+        objective,
         num_assets * [1.0 / num_assets],
+        jac=objective.jac,
         method="SLSQP",
         bounds=bounds,
         constraints=constraints,
@@ -98,7 +363,9 @@ def minimize_volatility(mean_returns, covariance_matrix, constraint_set=(0, 1)):
     return result
 
 
-def efficient_optimization(mean_returns, covariance_matrix, return_target, constraint_set=(0, 1)):
+def efficient_optimization(
+    mean_returns, covariance_matrix, return_target, constraint_set=(0, 1), x0=None
+):
     """
     Finds the portfolio with minimum volatility for a given target return.
 
@@ -107,27 +374,183 @@ def efficient_optimization(mean_returns, covariance_matrix, return_target, const
         covariance_matrix (pandas.DataFrame): Covariance matrix of the stocks.
         return_target (float): Target return for the efficient frontier.
         constraint_set (tuple): Bounds for each asset's allocation in the portfolio.
+        x0 (numpy.ndarray): Initial guess for the weights, e.g. the solution for a neighbouring
+            target return. Defaults to an equally weighted portfolio.
 
     Returns:
         OptimizeResult: Optimization result containing portfolio weights and performance metrics.
     """
     num_assets = len(mean_returns)
+    mu, cov = _annualize(mean_returns, covariance_matrix)
+    objective = _VolatilityObjective(_cholesky_factor(cov))
+    if x0 is None:
+        x0 = num_assets * [1.0 / num_assets]
     constraints = (
         {
             "type": "eq",
-            "fun": lambda x: calculate_portfolio_performance(x, mean_returns, covariance_matrix)[1]
-            - return_target,
+            "fun": _return_minus_target,
+            "jac": _return_minus_target_jac,
+            "args": (mu, return_target),
         },
-        {"type": "eq", "fun": lambda x: np.sum(x) - 1},
+        _BUDGET_CONSTRAINT,
     )
     bounds = tuple(constraint_set for _ in range(num_assets))
     result = minimize(
-        lambda x: calculate_portfolio_performance(x, mean_returns, covariance_matrix)[0],
-        num_assets * [1.0 / num_assets],
+        objective,
+        x0,
+        jac=objective.jac,
         method="SLSQP",
         bounds=bounds,
         constraints=constraints,
     )
     if not result.success:
         print(f"Warning: Optimization did not converge for target return {return_target}")
-    return result
\ No newline at end of file
+    return result
+
+
+def frontier_slsqp(mean_returns, covariance_matrix, target_returns, constraint_set=(0, 1), x0=None):
+    """
+    Traces the efficient frontier with warm-started SLSQP solves.
+
+    The targets are solved in order, each solve starting from the previous solution.
+
+    Args:
+        mean_returns (pandas.Series): Mean returns of the stocks.
+        covariance_matrix (pandas.DataFrame): Covariance matrix of the stocks.
+        target_returns (numpy.ndarray): Annualized target returns along the frontier, increasing.
+        constraint_set (tuple): Bounds for each asset's allocation in the portfolio.
+        x0 (numpy.ndarray): Initial guess for the first target, e.g. the min volatility weights.
+            Defaults to an equally weighted portfolio.
+
+    Returns:
+        tuple: Annualized volatilities (k,) and portfolio weights (k, n) for each target return.
+    """
+    mean_returns = _as_array(mean_returns)
+    covariance_matrix = _as_array(covariance_matrix)
+    target_returns = _as_array(target_returns)
+    volatilities = np.empty(len(target_returns))
+    weights = np.empty((len(target_returns), len(mean_returns)))
+    for i, return_target in enumerate(target_returns):
+        result = efficient_optimization(
+            mean_returns, covariance_matrix, return_target, constraint_set, x0=x0
+        )
+        volatilities[i] = result.fun
+        weights[i] = result.x
+        x0 = result.x
+    return volatilities, weights
+
+
+def frontier_analytic(mean_returns, covariance_matrix, target_returns, constraint_set=(0, 1)):
+    """
+    Computes the efficient frontier in closed form for a sweep of target returns.
+
+    Without bounds on the weights, the minimum-variance portfolio for a target return r is
+    w = inv(S) (lambda * mu + gamma * 1), so the covariance matrix is factorized once and every
+    target is solved with a handful of vectorized operations.
+
+    Args:
+        mean_returns (pandas.Series): Mean returns of the stocks.
+        covariance_matrix (pandas.DataFrame): Covariance matrix of the stocks.
+        target_returns (numpy.ndarray): Annualized target returns along the frontier.
+        constraint_set (tuple): Bounds for each asset's allocation in the portfolio. The closed
+            form is used only when both bounds are None; otherwise the frontier is traced with
+            warm-started SLSQP solves via frontier_slsqp.
+
+    Returns:
+        tuple: Annualized volatilities (k,) and portfolio weights (k, n) for each target return.
+    """
+    if tuple(constraint_set) != (None, None):
+        return frontier_slsqp(mean_returns, covariance_matrix, target_returns, constraint_set)
+
+    target_returns = _as_array(target_returns)
+
+    mu, cov = _annualize(mean_returns, covariance_matrix)
+    ones = np.ones_like(mu)
+
+    factor = cho_factor(cov)
+    inv_cov_mu = cho_solve(factor, mu)
+    inv_cov_ones = cho_solve(factor, ones)
+
+    a = ones @ inv_cov_mu
+    b = mu @ inv_cov_mu
+    c = ones @ inv_cov_ones
+    d = b * c - a**2
+
+    lam = (c * target_returns - a) / d
+    gamma = (b - a * target_returns) / d
+    weights = np.outer(lam, inv_cov_mu) + np.outer(gamma, inv_cov_ones)
+    volatilities, _ = calculate_portfolio_performance_batch(
+        weights, mean_returns, covariance_matrix
+    )
+    return volatilities, weights
+
+
+def frontier_osqp(mean_returns, covariance_matrix, target_returns, constraint_set=(0, 1)):
+    """
+    Traces the efficient frontier as a parametric QP solved with OSQP (requires osqp>=1.0).
+
+    Only the bounds of the target-return row change between frontier points, so the problem is
+    set up and its KKT system factorized once; each target is then an update of the constraint
+    bounds followed by a warm-started solve.
+
+    Args:
+        mean_returns (pandas.Series): Mean returns of the stocks.
+        covariance_matrix (pandas.DataFrame): Covariance matrix of the stocks.
+        target_returns (numpy.ndarray): Annualized target returns along the frontier.
+        constraint_set (tuple): Bounds for each asset's allocation in the portfolio.
+
+    Returns:
+        tuple: Annualized volatilities (k,) and portfolio weights (k, n) for each target return.
+    """
+    import osqp
+
+    # The solver settings below use the osqp 1.x names
+    if int(getattr(osqp, "__version__", "0").split(".")[0]) < 1:
+        raise ImportError(f"frontier_osqp requires osqp>=1.0, found {osqp.__version__}")
+
+    mu, cov = _annualize(mean_returns, covariance_matrix)
+    target_returns = _as_array(target_returns)
+    num_assets = len(mu)
+    lower, upper = constraint_set
+    lower = np.full(num_assets, -np.inf if lower is None else lower)
+    upper = np.full(num_assets, np.inf if upper is None else upper)
+
+    # Rows: target return, budget, per-asset bounds
+    constraint_matrix = sparse.vstack(
+        [mu[np.newaxis, :], np.ones((1, num_assets)), sparse.identity(num_assets)], format="csc"
+    )
+
+    def constraint_bounds(return_target):
+        return (
+            np.concatenate(([return_target, 1.0], lower)),
+            np.concatenate(([return_target, 1.0], upper)),
+        )
+
+    problem = osqp.OSQP()
+    problem.setup(
+        sparse.triu(2 * cov, format="csc"),
+        np.zeros(num_assets),
+        constraint_matrix,
+        *constraint_bounds(target_returns[0]),
+        verbose=False,
+        eps_abs=1e-10,
+        eps_rel=1e-10,
+        max_iter=100000,
+        polishing=True,
+    )
+
+    weights = np.empty((len(target_returns), num_assets))
+    for i, return_target in enumerate(target_returns):
+        l, u = constraint_bounds(return_target)
+        problem.update(l=l, u=u)
+        solution = problem.solve()
+        if solution.info.status not in ("solved", "solved inaccurate"):
+            print(f"Warning: Optimization did not converge for target return {return_target}")
+            weights[i] = np.nan
+        else:
+            weights[i] = solution.x
+
+    volatilities, _ = calculate_portfolio_performance_batch(
+        weights, mean_returns, covariance_matrix
+    )
+    return volatilities, weights
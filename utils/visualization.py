@@ -1,20 +1,84 @@
-import plotly.graph_objects as go
+import os
+
 import numpy as np
 
 
-def plot_efficient_frontier(max_sharpe_ratio, min_volatility, efficient_list, target_returns):
+def _plot_efficient_frontier_matplotlib(
+    max_sharpe_ratio, min_volatility, efficient_list, target_returns
+):
+    """
+    Plots the efficient frontier with matplotlib, which starts up faster than plotly.
+    """
+    import matplotlib.pyplot as plt
+
+    max_std, max_ret = max_sharpe_ratio
+    min_std, min_ret = min_volatility
+
+    fig, ax = plt.subplots(figsize=(8, 6))
+    ax.scatter(
+        max_std * 100,
+        max_ret * 100,
+        s=196,
+        color="red",
+        edgecolors="black",
+        linewidths=3,
+        label="Max Sharpe Ratio",
+        zorder=3,
+    )
+    ax.scatter(
+        min_std * 100,
+        min_ret * 100,
+        s=196,
+        color="green",
+        edgecolors="black",
+        linewidths=3,
+        label="Min Volatility",
+        zorder=3,
+    )
+    ax.plot(
+        efficient_list * 100,
+        target_returns * 100,
+        color="black",
+        linewidth=2,
+        label="Efficient Frontier",
+    )
+    ax.set_title("Portfolio Optimization with Efficient Frontier")
+    ax.set_xlabel("Annualized Volatility (%)")
+    ax.set_ylabel("Annualized Return (%)")
+    ax.legend(loc="lower right", edgecolor="black")
+    plt.show()
+
+
+def plot_efficient_frontier(
+    max_sharpe_ratio, min_volatility, efficient_list, target_returns, backend=None
+):
     """
     Plots the efficient frontier along with maximum Sharpe ratio and minimum volatility points.
 
     Args:
         max_sharpe_ratio (tuple): Standard deviation and returns of the max Sharpe ratio portfolio.
         min_volatility (tuple): Standard deviation and returns of the min volatility portfolio.
-        efficient_list (list): List of volatilities on the efficient frontier.
-        target_returns (list): List of target returns corresponding to the efficient frontier.
+        efficient_list (list or numpy.ndarray): Volatilities on the efficient frontier.
+        target_returns (list or numpy.ndarray): Target returns corresponding to the efficient
+            frontier.
+        backend (str): "plotly" or "matplotlib". Defaults to the EF_PLOT_BACKEND environment
+            variable, or "plotly" if it is unset.
 
     Returns:
         None
     """
+    efficient_list = np.asarray(efficient_list)
+    target_returns = np.asarray(target_returns)
+    backend = backend or os.environ.get("EF_PLOT_BACKEND", "plotly")
+    if backend == "matplotlib":
+        return _plot_efficient_frontier_matplotlib(
+            max_sharpe_ratio, min_volatility, efficient_list, target_returns
+        )
+    if backend != "plotly":
+        raise ValueError(f"Unknown plot backend: {backend}")
+
+    import plotly.graph_objects as go
+
     max_std, max_ret = max_sharpe_ratio
     min_std, min_ret = min_volatility
 
@@ -40,8 +104,8 @@ def plot_efficient_frontier(max_sharpe_ratio, min_volatility, efficient_list, ta
     efficient_frontier_trace = go.Scatter(
         name="Efficient Frontier",
         mode="lines",
-        x=np.round(np.array(efficient_list) * 100, 2),
-        y=np.round(np.array(target_returns) * 100, 2),
+        x=np.round(efficient_list * 100, 2),
+        y=np.round(target_returns * 100, 2),
         line=dict(color="black", width=2, dash="solid"),
     )
 